@@ -5,7 +5,6 @@ import logging
 
 import click
 from rich.console import Console
-from snaphelpers import Snap
 
 from sunbeam.core.checks import VerifyBootstrappedCheck, run_preflight_checks
 from sunbeam.core.common import (
@@ -17,7 +16,6 @@ from sunbeam.utils import click_option_show_hints
 
 LOG = logging.getLogger(__name__)
 console = Console()
-snap = Snap()
 
 
 @click.command()
@@ -128,6 +128,8 @@ class Deployment(pydantic.BaseModel):
     def load(cls, deployment: dict) -> "Deployment":
         """Load deployment from dict."""
         if type_ := deployment.get("type"):
+            # Instantiate through the class rather than model_validate or a
+            # TypeAdapter, subclasses may complete their fields in __init__.
             return _cls_registry.get(type_, Deployment)(**deployment)
         raise ValueError("Deployment type not set.")
 
@@ -1,9 +1,12 @@
 # SPDX-FileCopyrightText: 2024 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
+import hashlib
 import logging
-import shutil
+import os
 import tempfile
+import threading
 import typing
 from pathlib import Path
 from typing import TypeVar
@@ -17,29 +20,94 @@ from sunbeam.core.deployment import Deployment
 
 LOG = logging.getLogger(__name__)
 DEPLOYMENTS_CONFIG = SHARE_PATH / "deployments.yaml"
+# Deployment fields exposed by list_deployments
+_LIST_KEYS: set[str] = {"name", "url", "type"}
 
 T = TypeVar("T", bound=Deployment)
 
+# Prefer the libyaml-backed implementations, fall back on pure python ones
+# when PyYAML was built without libyaml.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+YAML_DUMPER.add_representer(str, str_presenter)
+
+# Parsed YAML documents keyed by path, along with the (mtime, size, digest) of
+# the file they were parsed from. Only the raw data is cached, deployments are
+# rebuilt on every load as they may complete their fields from other sources.
+_LOAD_CACHE: dict[Path, tuple[int, int, bytes, typing.Any]] = {}
+_LOAD_CACHE_LOCK = threading.Lock()
+# Directories already created by this process
+_ENSURED_DIRS: set[Path] = set()
+
 
 class DeploymentsConfig(pydantic.BaseModel):
     active: str | None = None
     deployments: list[Deployment] = []
     _path: Path | None = pydantic.PrivateAttr(default=None)
+    _by_name: dict[str, int] = pydantic.PrivateAttr(default_factory=dict)
+    # (digest, mtime, size) of the content last read from or written to _path
+    _on_disk: tuple[bytes, int, int] | None = pydantic.PrivateAttr(default=None)
 
     @pydantic.validator("deployments", pre=True, each_item=True)
     def _validate_deployments(cls, deployment: dict | Deployment) -> Deployment:  # noqa N805
         if isinstance(deployment, Deployment):
             return deployment
         if isinstance(deployment, dict):
+            # Always fully validate, model_construct would leave nested models
+            # (juju account / controller, certpair) as plain dicts and ignore
+            # aliases.
             return Deployment.load(deployment)
         raise ValueError(f"Invalid deployment {deployment}.")
 
+    def model_post_init(self, __context: typing.Any) -> None:
+        """Index deployments by name."""
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._by_name = {}
+        for i, d in enumerate(self.deployments):
+            # First occurrence wins on duplicated names, as in a linear scan
+            self._by_name.setdefault(d.name, i)
+
+    def _index_of(self, name: str) -> int | None:
+        """Return the position of deployment name, None if not found."""
+        idx = self._by_name.get(name)
+        if (
+            idx is None
+            or idx >= len(self.deployments)
+            or self.deployments[idx].name != name
+        ):
+            # deployments list could have been modified behind our back
+            self._reindex()
+            idx = self._by_name.get(name)
+        return idx
+
     @classmethod
     def load(cls, path: Path) -> "DeploymentsConfig":
-        """Load deployment configuration from file."""
-        LOG.debug("Loading deployment configuration from %r", str(path))
-        with path.open() as fd:
-            data = yaml.safe_load(fd)
+        """Load deployment configuration from file.
+
+        The parsed YAML is cached until the file changes on disk, the
+        configuration itself is built anew on every call.
+        """
+        stat = path.stat()
+        with _LOAD_CACHE_LOCK:
+            cached = _LOAD_CACHE.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            LOG.debug("Using cached deployment configuration for %r", str(path))
+            digest = cached[2]
+            data = copy.deepcopy(cached[3])
+        else:
+            LOG.debug("Loading deployment configuration from %r", str(path))
+            content = path.read_bytes()
+            digest = _digest(content)
+            data = yaml.load(content, Loader=_SafeLoader)  # noqa: S506
+            with _LOAD_CACHE_LOCK:
+                _LOAD_CACHE[path] = (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    digest,
+                    copy.deepcopy(data),
+                )
         if data is None:
             config = cls()
         elif not isinstance(data, dict):
@@ -48,27 +116,53 @@ class DeploymentsConfig(pydantic.BaseModel):
             )
         else:
             config = cls(**data)
+        config._on_disk = (digest, stat.st_mtime_ns, stat.st_size)
         config._path = path
         return config
 
     def write(self):
         """Write deployment configuration to file.
 
-        Writing to temporary file first in case there's an error during write.
-        Not to lose the original file.
+        Writing to a temporary file in the same directory first, then renaming
+        it over the original file. Not to lose the original file in case
+        there's an error during write.
+
+        Writing is skipped when the file already holds the same content.
         """
-        self_dict = self.model_dump(by_alias=True)
-        # self_dict has deployments with Deployment dict but not of provider
-        # so workaround to add each deployment based on provider
+        # model_dump only knows about the base Deployment fields, dump each
+        # deployment on its own to get the provider specific fields
+        self_dict = self.model_dump(by_alias=True, exclude={"deployments"})
         deployments = [d.model_dump(by_alias=True) for d in self.deployments]
         self_dict["deployments"] = deployments
+        content = yaml.dump(self_dict, Dumper=YAML_DUMPER, encoding="utf-8")
+        digest = _digest(content)
+        if self._on_disk is not None and self._on_disk[0] == digest:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                pass
+            else:
+                if self._on_disk[1:] == (stat.st_mtime_ns, stat.st_size):
+                    LOG.debug("Deployment configuration unchanged, not writing")
+                    return
         LOG.debug("Writing deployment configuration to %r", str(self.path))
-        yaml.SafeDumper.add_representer(str, str_presenter)
-        with tempfile.NamedTemporaryFile("w") as tmp:
-            yaml.safe_dump(self_dict, tmp)
-            tmp.flush()
-            shutil.copy(tmp.name, self.path)
-        self.path.chmod(0o600)
+        tmp = tempfile.NamedTemporaryFile(
+            "wb", dir=self.path.parent, prefix=f".{self.path.name}.", delete=False
+        )
+        try:
+            with tmp:
+                os.chmod(tmp.name, 0o600)
+                tmp.write(content)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp.name, self.path)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+        stat = self.path.stat()
+        self._on_disk = (digest, stat.st_mtime_ns, stat.st_size)
+        with _LOAD_CACHE_LOCK:
+            _LOAD_CACHE.pop(self.path, None)
 
     @property
     def path(self) -> Path:
@@ -84,10 +178,10 @@ class DeploymentsConfig(pydantic.BaseModel):
 
     def get_deployment(self, name: str) -> Deployment:
         """Get deployment."""
-        for deployment in self.deployments:
-            if deployment.name == name:
-                return deployment
-        raise ValueError(f"Deployment {name} not found in deployments.")
+        idx = self._index_of(name)
+        if idx is None:
+            raise ValueError(f"Deployment {name} not found in deployments.")
+        return self.deployments[idx]
 
     def refresh_deployment(self, deployment: T) -> T:
         """Refresh deployment."""
@@ -110,45 +204,33 @@ class DeploymentsConfig(pydantic.BaseModel):
 
     def add_deployment(self, deployment: Deployment) -> None:
         """Add a deployment to configuration."""
-        existing_deployment = None
-        try:
-            existing_deployment = self.get_deployment(deployment.name)
-        except ValueError:
-            # deployment does not exist
-            pass
-        if existing_deployment is not None:
+        if self._index_of(deployment.name) is not None:
             raise ValueError(f"Deployment {deployment.name} already exists.")
         self.deployments.append(deployment)
+        self._by_name[deployment.name] = len(self.deployments) - 1
         self.active = deployment.name
         self.write()
 
     def update_deployment(self, deployment: Deployment) -> None:
         """Update deployment in configuration."""
-        for i, dep in enumerate(self.deployments):
-            if dep.name == deployment.name:
-                self.deployments[i] = deployment
-                break
-        else:
+        idx = self._index_of(deployment.name)
+        if idx is None:
             raise ValueError(f"Deployment {deployment.name} not found in deployments.")
+        self.deployments[idx] = deployment
         self.write()
 
     def switch(self, name: str) -> None:
         """Switch active deployment."""
         if self.active == name:
             return
-        for deployment in self.deployments:
-            if deployment.name == name:
-                break
-        else:
+        if self._index_of(name) is None:
             raise ValueError(f"Deployment {name} not found in deployments.")
         self.active = name
         self.write()
 
     def get_minimal_info(self) -> dict:
         """Get deployments config with minimal information."""
-        self_dict = self.model_dump(by_alias=True)
-        # self_dict has deployments with Deployment dict but not of provider
-        # so workaround to add each deployment based on provider
+        self_dict = self.model_dump(by_alias=True, exclude={"deployments"})
         deployments = [
             d.model_dump(include={"name", "type", "primary_region_name"})
             for d in self.deployments
@@ -157,34 +239,45 @@ class DeploymentsConfig(pydantic.BaseModel):
         return self_dict
 
 
+def _digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _ensure_share_dir(snap: Snap) -> Path:
+    """Create the sunbeam share directory once per process."""
+    openstack = snap.paths.real_home / SHARE_PATH
+    if openstack not in _ENSURED_DIRS:
+        openstack.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(openstack)
+    return openstack
+
+
 def deployment_path(snap: Snap) -> Path:
     """Path to deployments configuration."""
-    openstack = snap.paths.real_home / SHARE_PATH
-    openstack.mkdir(parents=True, exist_ok=True)
+    _ensure_share_dir(snap)
     path = snap.paths.real_home / DEPLOYMENTS_CONFIG
-    if not path.exists():
-        path.touch(0o600)
-        path.write_text("{}")
+    try:
+        # Create the file exclusively, with the right mode from the start,
+        # a concurrent invocation losing the race uses the existing file
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        return path
+    with os.fdopen(fd, "w") as f:
+        f.write("{}")
     return path
 
 
 def store_deployment_as_yaml(snap: Snap, deployment: Deployment) -> Path:
     """Store a deployment as YAML and return the path."""
-    openstack = snap.paths.real_home / SHARE_PATH
-    openstack.mkdir(parents=True, exist_ok=True)
+    openstack = _ensure_share_dir(snap)
     path = openstack / (deployment.name + ".yaml")
-    path.write_text(yaml.safe_dump(deployment.dict()))
+    path.write_text(yaml.dump(deployment.dict(), Dumper=YAML_DUMPER))
     path.chmod(0o600)
     return path
 
 
 def list_deployments(config: DeploymentsConfig) -> dict:
     deployments = [
-        {
-            key: value
-            for key, value in deployment.dict().items()
-            if key in ["name", "url", "type"]
-        }
-        for deployment in config.deployments
+        deployment.model_dump(include=_LIST_KEYS) for deployment in config.deployments
     ]
     return {"active": config.active, "deployments": deployments}
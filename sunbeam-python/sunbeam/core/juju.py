@@ -1176,10 +1176,13 @@ class JujuHelper:
 
         Juju CLI can lose connection to the controller, especially in local mode
         embedded controller, while joining multiple nodes at the same time.
+        Retries after such errors back off exponentially, up to delay, not to
+        hammer a controller that is struggling.
         """
         if timeout is None:
             timeout = 300
         start = time.monotonic()
+        retry_delay = min(1.0, delay)
 
         while (time.monotonic() - start) < timeout:
             time_elapsed = time.monotonic() - start
@@ -1194,6 +1197,10 @@ class JujuHelper:
                 break
             except jubilant.CLIError as e:
                 LOG.error("Error occurred while waiting: %r", e)
+                remaining = timeout - (time.monotonic() - start)
+                if remaining > 0:
+                    time.sleep(min(retry_delay, remaining))
+                retry_delay = min(retry_delay * 2, delay)
         else:
             raise TimeoutError(
                 f"Timed out after {timeout} seconds while waiting for status"
@@ -6,7 +6,9 @@ import json
 import logging
 import os
 import subprocess
+import tempfile
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from string import Template
@@ -152,12 +154,26 @@ class TerraformHelper:
     def write_terraformrc(self) -> None:
         """Write .terraformrc file."""
         terraform_rc = self.snap.paths.user_data / ".terraformrc"
-        with terraform_rc.open(mode="w") as file:
-            file.write(
-                Template(terraform_rc_template).safe_substitute(
-                    {"snap_path": self.snap.paths.snap}
-                )
-            )
+        content = Template(terraform_rc_template).safe_substitute(
+            {"snap_path": self.snap.paths.snap}
+        )
+        # Several plans can be initialized concurrently, write to a temporary
+        # file and rename it so terraform never reads a truncated file.
+        tmp = tempfile.NamedTemporaryFile(
+            "w", dir=terraform_rc.parent, prefix=".terraformrc.", delete=False
+        )
+        try:
+            with tmp:
+                # NamedTemporaryFile creates 0600 files, use a fixed 0644
+                # rather than deriving it from the umask, as reading the
+                # umask means changing it process wide while plans may be
+                # initialized concurrently.
+                os.chmod(tmp.name, 0o644)
+                tmp.write(content)
+            os.replace(tmp.name, terraform_rc)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
 
     def reload_env(self, env: dict) -> None:
         """Update environment variables."""
@@ -775,13 +791,18 @@ class TerraformHelper:
 
 
 class TerraformInitStep(BaseStep):
-    """Initialize Terraform with required providers."""
+    """Initialize Terraform with required providers.
+
+    Additional helpers are initialized concurrently with the first one, their
+    plans being independent from each other.
+    """
 
-    def __init__(self, tfhelper: TerraformHelper):
+    def __init__(self, tfhelper: TerraformHelper, *tfhelpers: TerraformHelper):
         super().__init__(
             "Initialize Terraform", "Initializing Terraform from provider mirror"
         )
         self.tfhelper = tfhelper
+        self.tfhelpers = (tfhelper, *tfhelpers)
 
     def is_skip(self, context: StepContext) -> Result:
         """Determines if the step should be skipped or not.
@@ -793,8 +814,22 @@ class TerraformInitStep(BaseStep):
 
     def run(self, context: StepContext) -> Result:
         """Initialise Terraform configuration from provider mirror,."""
-        try:
-            self.tfhelper.init()
-            return Result(ResultType.COMPLETED)
-        except TerraformException as e:
-            return Result(ResultType.FAILED, str(e))
+        if len(self.tfhelpers) == 1:
+            try:
+                self.tfhelper.init()
+                return Result(ResultType.COMPLETED)
+            except TerraformException as e:
+                return Result(ResultType.FAILED, str(e))
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=len(self.tfhelpers)) as executor:
+            futures = [executor.submit(tfhelper.init) for tfhelper in self.tfhelpers]
+            for tfhelper, future in zip(self.tfhelpers, futures):
+                try:
+                    future.result()
+                except TerraformException as e:
+                    LOG.debug("Failed to initialize %s: %s", tfhelper.plan, e)
+                    errors.append(str(e))
+        if errors:
+            return Result(ResultType.FAILED, "\n".join(errors))
+        return Result(ResultType.COMPLETED)
@@ -69,6 +69,41 @@ class ConsulServerNetworks(enum.Enum):
     STORAGE = "storage"
 
 
+# consul-k8s serf lan node port per network
+CONSUL_SERF_LAN_PORTS = {
+    ConsulServerNetworks.MANAGEMENT: CONSUL_MANAGEMENT_SERF_LAN_PORT,
+    ConsulServerNetworks.TENANT: CONSUL_TENANT_SERF_LAN_PORT,
+    ConsulServerNetworks.STORAGE: CONSUL_STORAGE_SERF_LAN_PORT,
+}
+# consul-client network, serf lan port and space to bind consul endpoints to
+CONSUL_CLIENT_NETWORKS = (
+    (
+        ConsulServerNetworks.MANAGEMENT,
+        CONSUL_CLIENT_MANAGEMENT_SERF_LAN_PORT,
+        Networks.MANAGEMENT,
+    ),
+    (ConsulServerNetworks.TENANT, CONSUL_CLIENT_TENANT_SERF_LAN_PORT, Networks.DATA),
+    (
+        ConsulServerNetworks.STORAGE,
+        CONSUL_CLIENT_STORAGE_SERF_LAN_PORT,
+        Networks.STORAGE,
+    ),
+)
+
+
+def _fetch_spaces(
+    deployment: Deployment, networks: tuple[Networks, ...]
+) -> tuple[str | None, ...]:
+    """Return the spaces of networks, None for networks without a space."""
+    spaces: list[str | None] = []
+    for network in networks:
+        try:
+            spaces.append(deployment.get_space(network))
+        except ValueError:
+            spaces.append(None)
+    return tuple(spaces)
+
+
 class DeployConsulClientStep(BaseStep):
     """Deploy Consul Client using Terraform."""
 
@@ -93,7 +128,9 @@ class DeployConsulClientStep(BaseStep):
         self.client = self.deployment.get_client()
         self.model = self.deployment.openstack_machines_model
 
-    def _get_tfvars(self) -> dict:
+    def _get_tfvars(
+        self, clients_to_enable: dict[ConsulServerNetworks, bool] | None = None
+    ) -> dict:
         """Construct tfvars for consul client."""
         openstack_backend_config = self.openstack_tfhelper.backend_config()
 
@@ -104,97 +141,37 @@ class DeployConsulClientStep(BaseStep):
             "openstack-state-config": openstack_backend_config,
         }
 
-        clients_to_enable = ConsulFeature.consul_servers_to_enable(self.deployment)
+        if clients_to_enable is None:
+            clients_to_enable = ConsulFeature.consul_servers_to_enable(self.deployment)
         health_check_options = ConsulFeature.health_checks_to_enable(clients_to_enable)
 
         consul_config_map = {}
         consul_endpoint_bindings_map = {}
-        if clients_to_enable.get(ConsulServerNetworks.MANAGEMENT):
-            tfvars["enable-consul-management"] = True
-            _management_config = {
-                "serf-lan-port": CONSUL_CLIENT_MANAGEMENT_SERF_LAN_PORT,
-            }
-            _management_config.update(
-                ConsulFeature.get_config_from_manifest(
-                    self.manifest, "consul-client", ConsulServerNetworks.MANAGEMENT
-                )
-            )
-            if "enable-health-check" not in _management_config:
-                _management_config["enable-health-check"] = health_check_options[
-                    ConsulServerNetworks.MANAGEMENT
-                ]
-            consul_config_map["consul-management"] = _management_config
-            consul_endpoint_bindings_map["consul-management"] = [
-                {"space": self.deployment.get_space(Networks.MANAGEMENT)},
-                {
-                    "endpoint": "consul",
-                    "space": self.deployment.get_space(Networks.MANAGEMENT),
-                },
-                {
-                    "endpoint": "consul-notify",
-                    "space": self.deployment.get_space(Networks.MANAGEMENT),
-                },
-            ]
-        else:
-            tfvars["enable-consul-management"] = False
-
-        if clients_to_enable.get(ConsulServerNetworks.TENANT):
-            tfvars["enable-consul-tenant"] = True
-            _tenant_config = {
-                "serf-lan-port": CONSUL_CLIENT_TENANT_SERF_LAN_PORT,
-            }
-            _tenant_config.update(
+        management_space = None
+        if any(clients_to_enable.values()):
+            management_space = self.deployment.get_space(Networks.MANAGEMENT)
+        for network, serf_lan_port, space_network in CONSUL_CLIENT_NETWORKS:
+            name = f"consul-{network.value}"
+            if not clients_to_enable.get(network):
+                tfvars[f"enable-{name}"] = False
+                continue
+
+            tfvars[f"enable-{name}"] = True
+            _config = {"serf-lan-port": serf_lan_port}
+            _config.update(
                 ConsulFeature.get_config_from_manifest(
-                    self.manifest, "consul-client", ConsulServerNetworks.TENANT
+                    self.manifest, "consul-client", network
                 )
             )
-            if "enable-health-check" not in _tenant_config:
-                _tenant_config["enable-health-check"] = health_check_options[
-                    ConsulServerNetworks.TENANT
-                ]
-            consul_config_map["consul-tenant"] = _tenant_config
-            consul_endpoint_bindings_map["consul-tenant"] = [
-                {"space": self.deployment.get_space(Networks.MANAGEMENT)},
-                {
-                    "endpoint": "consul",
-                    "space": self.deployment.get_space(Networks.DATA),
-                },
-                {
-                    "endpoint": "consul-notify",
-                    "space": self.deployment.get_space(Networks.DATA),
-                },
+            if "enable-health-check" not in _config:
+                _config["enable-health-check"] = health_check_options[network]
+            consul_config_map[name] = _config
+            space = self.deployment.get_space(space_network)
+            consul_endpoint_bindings_map[name] = [
+                {"space": management_space},
+                {"endpoint": "consul", "space": space},
+                {"endpoint": "consul-notify", "space": space},
             ]
-        else:
-            tfvars["enable-consul-tenant"] = False
-
-        if clients_to_enable.get(ConsulServerNetworks.STORAGE):
-            tfvars["enable-consul-storage"] = True
-            _storage_config = {
-                "serf-lan-port": CONSUL_CLIENT_STORAGE_SERF_LAN_PORT,
-            }
-            _storage_config.update(
-                ConsulFeature.get_config_from_manifest(
-                    self.manifest, "consul-client", ConsulServerNetworks.STORAGE
-                )
-            )
-            if "enable-health-check" not in _storage_config:
-                _storage_config["enable-health-check"] = health_check_options[
-                    ConsulServerNetworks.STORAGE
-                ]
-            consul_config_map["consul-storage"] = _storage_config
-            consul_endpoint_bindings_map["consul-storage"] = [
-                {"space": self.deployment.get_space(Networks.MANAGEMENT)},
-                {
-                    "endpoint": "consul",
-                    "space": self.deployment.get_space(Networks.STORAGE),
-                },
-                {
-                    "endpoint": "consul-notify",
-                    "space": self.deployment.get_space(Networks.STORAGE),
-                },
-            ]
-        else:
-            tfvars["enable-consul-storage"] = False
 
         tfvars["consul-config-map"] = consul_config_map
         tfvars["consul-endpoint-bindings-map"] = consul_endpoint_bindings_map
@@ -202,7 +179,8 @@ class DeployConsulClientStep(BaseStep):
 
     def run(self, context: StepContext) -> Result:
         """Execute configuration using terraform."""
-        extra_tfvars = self._get_tfvars()
+        clients_to_enable = ConsulFeature.consul_servers_to_enable(self.deployment)
+        extra_tfvars = self._get_tfvars(clients_to_enable)
         try:
             self.update_status(context, "deploying services")
             self.tfhelper.update_tfvars_and_apply_tf(
@@ -216,7 +194,9 @@ class DeployConsulClientStep(BaseStep):
             LOG.warning("Error deploying consul client: %r", e)
             return Result(ResultType.FAILED, str(e))
 
-        apps = ConsulFeature.set_consul_client_application_names(self.deployment)
+        apps = ConsulFeature.set_consul_client_application_names(
+            self.deployment, clients_to_enable
+        )
         LOG.debug("Application monitored for readiness: %s", apps)
         status_queue: queue.Queue[str] = queue.Queue()
         task = update_status_background(self, apps, status_queue, context.status)
@@ -294,32 +274,24 @@ class ConsulFeature:
 
         Return dict to enable/disable consul server per network.
         """
+        management_space, storage_space, tenant_space = _fetch_spaces(
+            deployment, (Networks.MANAGEMENT, Networks.STORAGE, Networks.DATA)
+        )
+
         # Default to false
         enable = dict.fromkeys(ConsulServerNetworks, False)
-
-        try:
-            management_space = deployment.get_space(Networks.MANAGEMENT)
-            enable[ConsulServerNetworks.MANAGEMENT] = True
-        except ValueError:
-            management_space = None
-
+        enable[ConsulServerNetworks.MANAGEMENT] = management_space is not None
         # If storage space is same as management space, dont enable consul
         # server for storage
-        try:
-            storage_space = deployment.get_space(Networks.STORAGE)
-            if storage_space != management_space:
-                enable[ConsulServerNetworks.STORAGE] = True
-        except ValueError:
-            storage_space = None
-
+        if storage_space is not None and storage_space != management_space:
+            enable[ConsulServerNetworks.STORAGE] = True
         # If data space is same as either of management or storage space,
         # dont enable consul server for tenant
-        try:
-            tenant_space = deployment.get_space(Networks.DATA)
-            if tenant_space not in (management_space, storage_space):
-                enable[ConsulServerNetworks.TENANT] = True
-        except ValueError:
-            tenant_space = None
+        if tenant_space is not None and tenant_space not in (
+            management_space,
+            storage_space,
+        ):
+            enable[ConsulServerNetworks.TENANT] = True
 
         return enable
 
@@ -386,24 +358,49 @@ class ConsulFeature:
         return config
 
     @staticmethod
-    def set_application_names(deployment: Deployment) -> list:
-        """Application names handled by the terraform plan."""
-        enable = [
-            f"consul-{k.value}"
-            for k, v in ConsulFeature.consul_servers_to_enable(deployment).items()
-            if v
+    def enabled_network_values(
+        deployment: Deployment,
+        servers_to_enable: dict[ConsulServerNetworks, bool] | None = None,
+    ) -> tuple[str, ...]:
+        """Return the values of the networks with a consul server enabled.
+
+        servers_to_enable can be passed when already computed by the caller.
+        """
+        if servers_to_enable is None:
+            servers_to_enable = ConsulFeature.consul_servers_to_enable(deployment)
+        return tuple(k.value for k, v in servers_to_enable.items() if v)
+
+    @staticmethod
+    def set_application_names(
+        deployment: Deployment,
+        servers_to_enable: dict[ConsulServerNetworks, bool] | None = None,
+    ) -> list:
+        """Application names handled by the terraform plan.
+
+        servers_to_enable can be passed when already computed by the caller.
+        """
+        return [
+            f"consul-{network}"
+            for network in ConsulFeature.enabled_network_values(
+                deployment, servers_to_enable
+            )
         ]
-        return enable
 
     @staticmethod
-    def set_consul_client_application_names(deployment: Deployment) -> list:
-        """Application names handled by the consul client terraform plan."""
-        enable = [
-            f"consul-client-{k.value}"
-            for k, v in ConsulFeature.consul_servers_to_enable(deployment).items()
-            if v
+    def set_consul_client_application_names(
+        deployment: Deployment,
+        servers_to_enable: dict[ConsulServerNetworks, bool] | None = None,
+    ) -> list:
+        """Application names handled by the consul client terraform plan.
+
+        servers_to_enable can be passed when already computed by the caller.
+        """
+        return [
+            f"consul-client-{network}"
+            for network in ConsulFeature.enabled_network_values(
+                deployment, servers_to_enable
+            )
         ]
-        return enable
 
     @staticmethod
     def set_tfvars_on_enable(
@@ -415,56 +412,16 @@ class ConsulFeature:
         health_check_options = ConsulFeature.health_checks_to_enable(servers_to_enable)
 
         consul_config_map = {}
-        if servers_to_enable.get(ConsulServerNetworks.MANAGEMENT):
-            tfvars["enable-consul-management"] = True
-            _management_config = {}
-            # Manifest takes precedence
-            _management_config.update(
-                ConsulFeature.get_config_from_manifest(
-                    manifest, "consul-k8s", ConsulServerNetworks.MANAGEMENT
-                )
-            )
-            if "expose-gossip-and-rpc-ports" not in _management_config:
-                if health_check_options[ConsulServerNetworks.MANAGEMENT]:
-                    _management_config["expose-gossip-and-rpc-ports"] = "loadbalancer"
-                else:
-                    _management_config["expose-gossip-and-rpc-ports"] = "nodeport"
-            if "serflan-node-port" not in _management_config:
-                _management_config["serflan-node-port"] = (
-                    CONSUL_MANAGEMENT_SERF_LAN_PORT
-                )
-            consul_config_map["consul-management"] = _management_config
-        else:
-            tfvars["enable-consul-management"] = False
+        for network in ConsulServerNetworks:
+            name = f"consul-{network.value}"
+            if not servers_to_enable.get(network):
+                tfvars[f"enable-{name}"] = False
+                continue
 
-        if servers_to_enable.get(ConsulServerNetworks.TENANT):
-            tfvars["enable-consul-tenant"] = True
-            _tenant_config = {}
+            tfvars[f"enable-{name}"] = True
             # Manifest takes precedence
-            _tenant_config.update(
-                ConsulFeature.get_config_from_manifest(
-                    manifest, "consul-k8s", ConsulServerNetworks.TENANT
-                )
-            )
-            if "expose-gossip-and-rpc-ports" not in _tenant_config:
-                if health_check_options[ConsulServerNetworks.TENANT]:
-                    _tenant_config["expose-gossip-and-rpc-ports"] = "loadbalancer"
-                else:
-                    _tenant_config["expose-gossip-and-rpc-ports"] = "nodeport"
-            if "serflan-node-port" not in _tenant_config:
-                _tenant_config["serflan-node-port"] = CONSUL_TENANT_SERF_LAN_PORT
-            consul_config_map["consul-tenant"] = _tenant_config
-        else:
-            tfvars["enable-consul-tenant"] = False
-
-        if servers_to_enable.get(ConsulServerNetworks.STORAGE):
-            tfvars["enable-consul-storage"] = True
-            _storage_config = {}
-            # Manifest takes precedence
-            _storage_config.update(
-                ConsulFeature.get_config_from_manifest(
-                    manifest, "consul-k8s", ConsulServerNetworks.STORAGE
-                )
+            _config = dict(
+                ConsulFeature.get_config_from_manifest(manifest, "consul-k8s", network)
             )
             # Given the logic for masakarimonitors matrix to determine when to
             # apply action recovery, recovery is needed only when storage network
@@ -474,20 +431,18 @@ class ConsulFeature:
             # management network.
             # For storage network, the consul-server should expose the gossip port
             # as loadbalancer to enable health check from consul-client.
-            # So only update option expose-gossip-and-rpc-ports for Storage
-            # network and ignore for other networks.
+            # health_checks_to_enable only enables the check on storage network,
+            # or on management network when it carries the storage traffic.
             # This also reduces the number of metallb ip allocations for
             # instance-recovery feature to 1, that too only if storage network exists.
-            if "expose-gossip-and-rpc-ports" not in _storage_config:
-                if health_check_options[ConsulServerNetworks.STORAGE]:
-                    _storage_config["expose-gossip-and-rpc-ports"] = "loadbalancer"
+            if "expose-gossip-and-rpc-ports" not in _config:
+                if health_check_options[network]:
+                    _config["expose-gossip-and-rpc-ports"] = "loadbalancer"
                 else:
-                    _storage_config["expose-gossip-and-rpc-ports"] = "nodeport"
-            if "serflan-node-port" not in _storage_config:
-                _storage_config["serflan-node-port"] = CONSUL_STORAGE_SERF_LAN_PORT
-            consul_config_map["consul-storage"] = _storage_config
-        else:
-            tfvars["enable-consul-storage"] = False
+                    _config["expose-gossip-and-rpc-ports"] = "nodeport"
+            if "serflan-node-port" not in _config:
+                _config["serflan-node-port"] = CONSUL_SERF_LAN_PORTS[network]
+            consul_config_map[name] = _config
 
         tfvars["consul-config-map"] = consul_config_map
         return tfvars
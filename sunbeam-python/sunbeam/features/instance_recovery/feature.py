@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -110,12 +111,13 @@ class InstanceRecoveryFeature(OpenStackControlPlaneFeature):
         tfhelper_hypervisor = deployment.get_tfhelper("hypervisor-plan")
         tfhelper_consul_client = deployment.get_tfhelper(self.tf_plan_consul_client)
         jhelper = JujuHelper(deployment.juju_controller)
+        client = deployment.get_client()
         plan1: list[BaseStep] = []
         if self.user_manifest:
-            plan1.append(AddManifestStep(deployment.get_client(), self.user_manifest))
+            plan1.append(AddManifestStep(client, self.user_manifest))
         plan1.extend(
             [
-                TerraformInitStep(tfhelper),
+                TerraformInitStep(tfhelper, tfhelper_consul_client),
                 EnableOpenStackApplicationStep(
                     deployment, config, tfhelper, jhelper, self
                 ),
@@ -130,7 +132,6 @@ class InstanceRecoveryFeature(OpenStackControlPlaneFeature):
                 "steps"
             )
             LOG.debug(message)
-            client = deployment.get_client()
             maas_client = MaasClient.from_deployment(deployment)
             plan2.extend(
                 [
@@ -147,31 +148,31 @@ class InstanceRecoveryFeature(OpenStackControlPlaneFeature):
                     ),
                 ]
             )
-        plan2.extend(
-            [
-                TerraformInitStep(tfhelper_consul_client),
-                consul.DeployConsulClientStep(
-                    deployment=deployment,
-                    # feature=self,
-                    tfhelper=tfhelper_consul_client,
-                    openstack_tfhelper=tfhelper,
-                    jhelper=jhelper,
-                    manifest=self.manifest,
-                ),
-            ]
+        plan2.append(
+            consul.DeployConsulClientStep(
+                deployment=deployment,
+                # feature=self,
+                tfhelper=tfhelper_consul_client,
+                openstack_tfhelper=tfhelper,
+                jhelper=jhelper,
+                manifest=self.manifest,
+            )
         )
-        run_plan(plan2, console, show_hints)
+        # The masakari offer is part of the openstack plan applied in plan1,
+        # read it while the consul client gets deployed.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            openstack_tf_output = executor.submit(tfhelper_openstack.output)
+            run_plan(plan2, console, show_hints)
 
-        openstack_tf_output = tfhelper_openstack.output()
         extra_tfvars = {
-            "masakari-offer-url": openstack_tf_output.get("masakari-offer-url")
+            "masakari-offer-url": openstack_tf_output.result().get("masakari-offer-url")
         }
         plan3: list[BaseStep] = []
         plan3.extend(
             [
                 TerraformInitStep(tfhelper_hypervisor),
                 ReapplyHypervisorTerraformPlanStep(
-                    deployment.get_client(),
+                    client,
                     tfhelper_hypervisor,
                     jhelper,
                     self.manifest,
@@ -191,7 +192,7 @@ class InstanceRecoveryFeature(OpenStackControlPlaneFeature):
         jhelper = JujuHelper(deployment.juju_controller)
         extra_tfvars = {"masakari-offer-url": None}
         plan = [
-            TerraformInitStep(tfhelper_hypervisor),
+            TerraformInitStep(tfhelper_hypervisor, tfhelper_consul_client, tfhelper),
             ReapplyHypervisorTerraformPlanStep(
                 deployment.get_client(),
                 tfhelper_hypervisor,
@@ -206,9 +207,7 @@ class InstanceRecoveryFeature(OpenStackControlPlaneFeature):
                 OPENSTACK_MODEL,
                 saas_apps_to_delete=self.set_application_names(deployment),
             ),
-            TerraformInitStep(tfhelper_consul_client),
             consul.RemoveConsulClientStep(deployment, tfhelper_consul_client, jhelper),
-            TerraformInitStep(tfhelper),
             DisableOpenStackApplicationStep(deployment, tfhelper, jhelper, self),
         ]
 
@@ -3,6 +3,7 @@
 
 import base64
 import binascii
+import functools
 import logging
 import re
 import typing
@@ -26,6 +27,9 @@ else:
 
 
 LOG = logging.getLogger()
+_PEM_CERTIFICATE_RE = re.compile(
+    rb"(?=-----BEGIN CERTIFICATE-----)(.*?)(?<=-----END CERTIFICATE-----)", re.DOTALL
+)
 
 
 def normalize_pem(pem_bytes: bytes) -> bytes:
@@ -33,6 +37,19 @@ def normalize_pem(pem_bytes: bytes) -> bytes:
     return pem_bytes.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
 
 
+@functools.lru_cache(maxsize=64)
+def _load_certificate(certificate: str | bytes) -> tuple[bytes, "x509.Certificate"]:
+    """Decode and parse a base64 encoded PEM certificate.
+
+    The same certificate is usually checked by several validators in a row,
+    parsed certificates are immutable and safe to share.
+
+    :returns: Tuple of normalized PEM bytes and the parsed certificate
+    """
+    pem_bytes = normalize_pem(base64.b64decode(certificate))
+    return pem_bytes, x509.load_pem_x509_certificate(pem_bytes)
+
+
 def get_all_registered_groups(cli: click.Group) -> dict:
     """Get all the registered groups from cli object.
 
@@ -50,8 +67,9 @@ def get_all_registered_groups(cli: click.Group) -> dict:
 
     def _get_all_groups(group):
         groups = {}
-        for cmd in group.list_commands({}):
-            obj = group.get_command({}, cmd)
+        # Walk the registered commands directly, list_commands sorts the names
+        # and get_command looks each of them up again.
+        for cmd, obj in group.commands.items():
             if isinstance(obj, click.Group):
                 # cli group name is init
                 if group.name == "init":
@@ -70,9 +88,11 @@ def get_all_registered_groups(cli: click.Group) -> dict:
 
 
 def is_certificate_valid(certificate: bytes) -> bool:
+    if not certificate:
+        return False
+
     try:
-        certificate_bytes = base64.b64decode(certificate)
-        x509.load_pem_x509_certificate(certificate_bytes)
+        _load_certificate(certificate)
     except (binascii.Error, TypeError, ValueError) as e:
         LOG.debug("Failed to validate certificate: %r", e)
         return False
@@ -83,8 +103,7 @@ def is_certificate_valid(certificate: bytes) -> bool:
 def is_ca_certificate(certificate: str | bytes) -> bool:
     """Return True if the certificate has BasicConstraints CA:TRUE."""
     try:
-        cert_bytes = base64.b64decode(certificate)
-        cert = x509.load_pem_x509_certificate(cert_bytes)
+        _, cert = _load_certificate(certificate)
         bc = cert.extensions.get_extension_for_class(x509.BasicConstraints)
         return bc.value.ca
     except Exception as e:
@@ -96,8 +115,7 @@ def validate_ca_certificate(
     ctx: click.core.Context, param: click.core.Option, value: str
 ) -> str:
     try:
-        ca_bytes = normalize_pem(base64.b64decode(value))
-        x509.load_pem_x509_certificate(ca_bytes)
+        ca_bytes, _ = _load_certificate(value)
         return base64.b64encode(ca_bytes).decode()
     except (binascii.Error, TypeError, ValueError) as e:
         LOG.debug("Failed to validate CA certificate: %r", e)
@@ -107,30 +125,20 @@ def validate_ca_certificate(
 def validate_ca_chain(
     ctx: click.core.Context, param: click.core.Option, value: str | None
 ) -> str | None:
-    if value is None:
-        return None
+    if not value:
+        return value
 
     try:
         chain_bytes = normalize_pem(base64.b64decode(value))
-        chain_list = re.findall(
-            pattern=(
-                "(?=-----BEGIN CERTIFICATE-----)(.*?)(?<=-----END CERTIFICATE-----)"
-            ),
-            string=chain_bytes.decode(),
-            flags=re.DOTALL,
-        )
-
-        if len(chain_list) < 2:
-            # Just validate individual certs
-            for cert in chain_list:
-                x509.load_pem_x509_certificate(cert.encode())
-
-            return base64.b64encode(chain_bytes).decode()
+        # Parse every certificate once, resolving the lazy import only once
+        load_pem_x509_certificate = x509.load_pem_x509_certificate
+        certs = [
+            load_pem_x509_certificate(match.group(0))
+            for match in _PEM_CERTIFICATE_RE.finditer(chain_bytes)
+        ]
 
         # Check if the chain is in correct order
-        for i in range(len(chain_list) - 1):
-            cert = x509.load_pem_x509_certificate(chain_list[i].encode())
-            issuer = x509.load_pem_x509_certificate(chain_list[i + 1].encode())
+        for cert, issuer in zip(certs, certs[1:]):
             cert.verify_directly_issued_by(issuer)
 
         return base64.b64encode(chain_bytes).decode()
@@ -196,6 +196,25 @@ def write_cos_storage_dict(client: Client, storage: dict):
     update_config(client, COS_STORAGE_KEY, storage)
 
 
+def get_cos_model_tfvars(
+    deployment: Deployment, cloud: str, model_config: dict | None = None
+) -> dict:
+    """Returns the terraform variables defining the COS model.
+
+    Proxy settings and the default storage class are applied on top of
+    model_config, which is left untouched.
+    """
+    config = dict(model_config or {})
+    config.update(convert_proxy_to_model_configs(deployment.get_proxy_settings()))
+    config.update({"workload-storage": K8SHelper.get_default_storageclass()})
+    return {
+        "model": OBSERVABILITY_MODEL,
+        "cloud": cloud,
+        "credential": f"{cloud}{CREDENTIAL_SUFFIX}",
+        "config": config,
+    }
+
+
 class DeployObservabilityStackStep(BaseStep, JujuStepHelper):
     """Deploy Observability Stack using Terraform."""
 
@@ -250,16 +269,7 @@ class DeployObservabilityStackStep(BaseStep, JujuStepHelper):
             )
         else:
             model_config = {}
-        proxy_settings = self.deployment.get_proxy_settings()
-        model_config.update(convert_proxy_to_model_configs(proxy_settings))
-        model_config.update({"workload-storage": K8SHelper.get_default_storageclass()})
-
-        extra_tfvars: dict = {
-            "model": self.model,
-            "cloud": self.cloud,
-            "credential": f"{self.cloud}{CREDENTIAL_SUFFIX}",
-            "config": model_config,
-        }
+        extra_tfvars = get_cos_model_tfvars(self.deployment, self.cloud, model_config)
 
         # Get COS storage from database and manifest
         client = self.deployment.get_client()
@@ -346,15 +356,7 @@ class UpdateObservabilityModelConfigStep(BaseStep, JujuStepHelper):
 
     def run(self, context: StepContext) -> Result:
         """Execute configuration using terraform."""
-        proxy_settings = self.deployment.get_proxy_settings()
-        model_config = convert_proxy_to_model_configs(proxy_settings)
-        model_config.update({"workload-storage": K8SHelper.get_default_storageclass()})
-        extra_tfvars = {
-            "model": self.model,
-            "cloud": self.cloud,
-            "credential": f"{self.cloud}{CREDENTIAL_SUFFIX}",
-            "config": model_config,
-        }
+        extra_tfvars = get_cos_model_tfvars(self.deployment, self.cloud)
 
         try:
             self.tfhelper.update_tfvars_and_apply_tf(
@@ -1400,11 +1402,10 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
             )
             return
 
+        tfhelper_cos = deployment.get_tfhelper(self.tfplan_cos)
         plan = [
-            TerraformInitStep(deployment.get_tfhelper(self.tfplan_cos)),
-            UpdateObservabilityModelConfigStep(
-                deployment, self, deployment.get_tfhelper(self.tfplan_cos)
-            ),
+            TerraformInitStep(tfhelper_cos),
+            UpdateObservabilityModelConfigStep(deployment, self, tfhelper_cos),
         ]
         run_plan(plan, console, show_hints)
 
@@ -1423,13 +1424,25 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
             self.tfplan_hardware_observer
         )
 
+        tfhelpers = [
+            tfhelper_cos,
+            tfhelper,
+            tfhelper_observability_agent,
+            tfhelper_hardware_observer,
+        ]
+        if is_maas_deployment(deployment):
+            tfhelper_observability_agent_infra = deployment.get_tfhelper(
+                self.tfplan_observability_agent_infra
+            )
+            tfhelpers.append(tfhelper_observability_agent_infra)
+
         client = deployment.get_client()
-        plan = []
+        plan: list[BaseStep] = []
         if self.user_manifest:
             plan.append(AddManifestStep(client, self.user_manifest))
+        plan.append(TerraformInitStep(*tfhelpers))
 
-        cos_plan = [
-            TerraformInitStep(tfhelper_cos),
+        cos_plan: list[BaseStep] = [
             DeployObservabilityStackStep(deployment, self, tfhelper_cos, jhelper),
         ]
         if is_maas_deployment(deployment):
@@ -1439,7 +1452,6 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
         cos_plan.append(PatchCosLoadBalancerIPStep(client))
 
         observability_agent_k8s_plan = [
-            TerraformInitStep(tfhelper),
             EnableOpenStackApplicationStep(
                 deployment,
                 config,
@@ -1452,14 +1464,12 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
         ]
 
         observability_agent_plan = [
-            TerraformInitStep(tfhelper_observability_agent),
             DeployObservabilityAgentStep(
                 deployment, config, self, tfhelper_observability_agent, jhelper
             ),
         ]
 
         hardware_observer_plan = [
-            TerraformInitStep(tfhelper_hardware_observer),
             DeployHardwareObserverStep(
                 deployment, config, self, tfhelper_hardware_observer, jhelper
             ),
@@ -1472,11 +1482,7 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
         run_plan(hardware_observer_plan, console, show_hints)
 
         if is_maas_deployment(deployment):
-            tfhelper_observability_agent_infra = deployment.get_tfhelper(
-                self.tfplan_observability_agent_infra
-            )
             infra_agent_plan = [
-                TerraformInitStep(tfhelper_observability_agent_infra),
                 DeployObservabilityAgentInfraStep(
                     deployment,
                     self,
@@ -1500,8 +1506,21 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
             self.tfplan_hardware_observer
         )
 
+        tfhelpers = [
+            tfhelper,
+            tfhelper_hardware_observer,
+            tfhelper_observability_agent,
+            tfhelper_cos,
+        ]
+        if is_maas_deployment(deployment):
+            tfhelper_observability_agent_infra = deployment.get_tfhelper(
+                self.tfplan_observability_agent_infra
+            )
+            tfhelpers.append(tfhelper_observability_agent_infra)
+
+        init_plan = [TerraformInitStep(*tfhelpers)]
+
         observability_agent_k8s_plan = [
-            TerraformInitStep(tfhelper),
             DisableOpenStackApplicationStep(deployment, tfhelper, jhelper, self),
             RemoveSaasApplicationsStep(
                 jhelper, OPENSTACK_MODEL, offering_model=OBSERVABILITY_MODEL
@@ -1509,14 +1528,12 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
         ]
 
         hardware_observer_plan = [
-            TerraformInitStep(tfhelper_hardware_observer),
             RemoveHardwareObserverStep(
                 deployment, self, tfhelper_hardware_observer, jhelper
             ),
         ]
 
         observability_agent_plan = [
-            TerraformInitStep(tfhelper_observability_agent),
             RemoveObservabilityAgentStep(
                 deployment, self, tfhelper_observability_agent, jhelper
             ),
@@ -1528,19 +1545,15 @@ class EmbeddedObservabilityFeature(ObservabilityFeature):
         ]
 
         cos_plan = [
-            TerraformInitStep(tfhelper_cos),
             RemoveObservabilityStackStep(deployment, self, tfhelper_cos, jhelper),
         ]
 
+        run_plan(init_plan, console, show_hints)
         run_plan(observability_agent_k8s_plan, console, show_hints)
         run_plan(hardware_observer_plan, console, show_hints)
 
         if is_maas_deployment(deployment):
-            tfhelper_observability_agent_infra = deployment.get_tfhelper(
-                self.tfplan_observability_agent_infra
-            )
             infra_agent_remove_plan = [
-                TerraformInitStep(tfhelper_observability_agent_infra),
                 RemoveObservabilityAgentInfraStep(
                     deployment, self, tfhelper_observability_agent_infra, jhelper
                 ),
@@ -1657,13 +1670,24 @@ class ExternalObservabilityFeature(ObservabilityFeature):
             self.tfplan_hardware_observer
         )
 
+        tfhelpers = [
+            tfhelper,
+            tfhelper_observability_agent,
+            tfhelper_hardware_observer,
+        ]
+        if is_maas_deployment(deployment):
+            tfhelper_observability_agent_infra = deployment.get_tfhelper(
+                self.tfplan_observability_agent_infra
+            )
+            tfhelpers.append(tfhelper_observability_agent_infra)
+
         client = deployment.get_client()
-        plan = []
+        plan: list[BaseStep] = []
         if self.user_manifest:
             plan.append(AddManifestStep(client, self.user_manifest))
+        plan.append(TerraformInitStep(*tfhelpers))
 
         observability_agent_k8s_plan = [
-            TerraformInitStep(tfhelper),
             EnableOpenStackApplicationStep(
                 deployment,
                 config,
@@ -1675,7 +1699,6 @@ class ExternalObservabilityFeature(ObservabilityFeature):
         ]
 
         observability_agent_plan = [
-            TerraformInitStep(tfhelper_observability_agent),
             DeployObservabilityAgentStep(
                 deployment,
                 config,
@@ -1687,7 +1710,6 @@ class ExternalObservabilityFeature(ObservabilityFeature):
         ]
 
         hardware_observer_plan = [
-            TerraformInitStep(tfhelper_hardware_observer),
             DeployHardwareObserverStep(
                 deployment, config, self, tfhelper_hardware_observer, jhelper
             ),
@@ -1705,11 +1727,7 @@ class ExternalObservabilityFeature(ObservabilityFeature):
         run_plan(hardware_observer_plan, console, show_hints)
 
         if is_maas_deployment(deployment):
-            tfhelper_observability_agent_infra = deployment.get_tfhelper(
-                self.tfplan_observability_agent_infra
-            )
             infra_agent_plan = [
-                TerraformInitStep(tfhelper_observability_agent_infra),
                 DeployObservabilityAgentInfraStep(
                     deployment,
                     self,
@@ -1735,14 +1753,26 @@ class ExternalObservabilityFeature(ObservabilityFeature):
             self.tfplan_hardware_observer
         )
 
+        tfhelpers = [
+            tfhelper,
+            tfhelper_hardware_observer,
+            tfhelper_observability_agent,
+        ]
+        if is_maas_deployment(deployment):
+            tfhelper_observability_agent_infra = deployment.get_tfhelper(
+                self.tfplan_observability_agent_infra
+            )
+            tfhelpers.append(tfhelper_observability_agent_infra)
+
+        init_plan = [TerraformInitStep(*tfhelpers)]
+
         # Workaround as integrations are not handled in terraform plan
         # https://github.com/juju/terraform-provider-juju/issues/119
         observability_remove_offers_plan = [
-            RemoveRemoteCosOffersStep(deployment, self, jhelper)
+            RemoveRemoteCosOffersStep(deployment, self, jhelper),
         ]
 
         observability_agent_k8s_plan = [
-            TerraformInitStep(tfhelper),
             DisableOpenStackApplicationStep(deployment, tfhelper, jhelper, self),
             RemoveSaasApplicationsStep(
                 jhelper,
@@ -1752,14 +1782,12 @@ class ExternalObservabilityFeature(ObservabilityFeature):
         ]
 
         hardware_observer_plan = [
-            TerraformInitStep(tfhelper_hardware_observer),
             RemoveHardwareObserverStep(
                 deployment, self, tfhelper_hardware_observer, jhelper
             ),
         ]
 
         grafana_agent_plan = [
-            TerraformInitStep(tfhelper_observability_agent),
             RemoveObservabilityAgentStep(
                 deployment, self, tfhelper_observability_agent, jhelper
             ),
@@ -1770,16 +1798,13 @@ class ExternalObservabilityFeature(ObservabilityFeature):
             ),
         ]
 
+        run_plan(init_plan, console, show_hints)
         run_plan(observability_remove_offers_plan, console, show_hints)
         run_plan(observability_agent_k8s_plan, console, show_hints)
         run_plan(hardware_observer_plan, console, show_hints)
 
         if is_maas_deployment(deployment):
-            tfhelper_observability_agent_infra = deployment.get_tfhelper(
-                self.tfplan_observability_agent_infra
-            )
             infra_agent_remove_plan = [
-                TerraformInitStep(tfhelper_observability_agent_infra),
                 RemoveObservabilityAgentInfraStep(
                     deployment, self, tfhelper_observability_agent_infra, jhelper
                 ),
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import logging
 import pathlib
 import sys
@@ -21,6 +22,7 @@ from sunbeam.core.common import (
 )
 from sunbeam.core.deployment import Deployment, register_deployment_type
 from sunbeam.core.deployments import (
+    YAML_DUMPER,
     DeploymentsConfig,
     deployment_path,
     list_deployments,
@@ -52,10 +54,16 @@ def load_deployment(path: Path) -> Deployment:
     return deployments.get_active()
 
 
+@functools.cache
+def _providers() -> tuple[ProviderBase, ...]:
+    """Return the providers, shared by deployment type and CLI registration."""
+    # TODO(gboutry): hook to register deployment type automatically
+    return (LocalProvider(), MaasProvider())
+
+
 def register_providers() -> None:
     """Auto-register providers."""
-    providers: list[ProviderBase] = [LocalProvider(), MaasProvider()]
-    for provider_obj in providers:
+    for provider_obj in _providers():
         deployment_type = provider_obj.deployment_type()
         if deployment_type:
             LOG.debug("Registering deployment type: %s", deployment_type)
@@ -199,7 +207,7 @@ def list_providers(format: str) -> None:
             table.add_row(name, url, type, style=style)
         console.print(table)
     elif format == FORMAT_YAML:
-        console.print(yaml.dump(deployment_list), end="")
+        yaml.dump(deployment_list, sys.stdout, Dumper=YAML_DUMPER)
 
 
 @deployment_group.command()
@@ -231,7 +239,7 @@ def show(name: str, format: str):
             table.add_row(f"[bold]{header.capitalize()}[/bold]", str(value))
         console.print(table)
     elif format == FORMAT_YAML:
-        console.print(yaml.dump(deployment), end="")
+        yaml.dump(deployment.dict(), sys.stdout, Dumper=YAML_DUMPER)
 
 
 @deployment_group.command("update-clusterd-credentials")
@@ -256,12 +264,7 @@ def update_clusterd_credentials(ctx, show_hints: bool = False):
 def register_cli(cli: click.Group, configure: click.Group, deployment: Deployment):
     """Register the CLI for the given provider."""
     cli.add_command(deployment_group)
-    providers: list[ProviderBase] = [
-        LocalProvider(),
-        # TODO(gboutry): hook to register deployment type automatically
-        MaasProvider(),
-    ]
-    for provider_obj in providers:
+    for provider_obj in _providers():
         provider_obj.register_add_cli(add)
         type_name, type_cls = provider_obj.deployment_type()
         if isinstance(deployment, type_cls):
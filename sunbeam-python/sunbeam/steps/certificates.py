@@ -47,8 +47,10 @@ class DeployCertificatesProviderApplicationStep(BaseStep):
     def run(self, context: StepContext) -> Result:
         """Deploy sunbeam clusterd to infra machines."""
         self.update_status(context, "fetching infra machines")
-        clusterd_machines = self.jhelper.get_machines(self.model)
-        machines = list(clusterd_machines.keys())
+        # One status snapshot provides both the machines and the applications
+        # already in the model, saving a round-trip after deploy
+        status = self.jhelper.get_model_status(self.model)
+        machines = list(status.machines.keys())
 
         if len(machines) == 0:
             return Result(ResultType.FAILED, f"No machines found in {self.model} model")
@@ -69,7 +71,9 @@ class DeployCertificatesProviderApplicationStep(BaseStep):
             base=JUJU_BASE,
         )
 
-        apps = self.jhelper.get_application_names(self.model)
+        apps = list(status.apps.keys())
+        if APPLICATION not in apps:
+            apps.append(APPLICATION)
         try:
             self.jhelper.wait_until_active(
                 self.model,
@@ -78,6 +82,22 @@ class DeployCertificatesProviderApplicationStep(BaseStep):
             )
         except (JujuWaitException, TimeoutError) as e:
             LOG.warning("Timed out waiting for certificates application: %r", e)
+            try:
+                model_status = self.jhelper.get_model_status(self.model)
+            except Exception:
+                LOG.debug("Could not fetch post-wait status", exc_info=True)
+            else:
+                for app in apps:
+                    app_info = model_status.apps.get(app)
+                    if app_info is None:
+                        LOG.warning("Application %r workload status: missing", app)
+                        continue
+                    LOG.warning(
+                        "Application %r workload status: %s, message: %r",
+                        app,
+                        app_info.app_status.current,
+                        app_info.app_status.message,
+                    )
             return Result(ResultType.FAILED, str(e))
 
         return Result(ResultType.COMPLETED)
@@ -288,10 +288,24 @@ def get_local_cidr_matching_token(token: str) -> str:
     raise ValueError("No local networks found matching join token addresses.")
 
 
+_RANDOM_ALPHABET = (string.ascii_letters + string.digits).encode()
+# Map every random byte to a character from its low 6 bits, bytes whose low
+# 6 bits fall outside the alphabet are dropped to keep the output uniform.
+_RANDOM_TABLE = bytes(
+    _RANDOM_ALPHABET[b & 0x3F] if b & 0x3F < len(_RANDOM_ALPHABET) else 0
+    for b in range(256)
+)
+_RANDOM_REJECT = bytes(b for b in range(256) if b & 0x3F >= len(_RANDOM_ALPHABET))
+
+
 def random_string(length: int) -> str:
     """Utility function to generate secure random string."""
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for i in range(length))
+    result = b""
+    while len(result) < length:
+        # Over-provision, about 3% of the bytes get rejected
+        raw = secrets.token_bytes(length - len(result) + 8)
+        result += raw.translate(_RANDOM_TABLE, _RANDOM_REJECT)
+    return result[:length].decode()
 
 
 def generate_password() -> str:
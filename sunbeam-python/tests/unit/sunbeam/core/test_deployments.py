@@ -0,0 +1,270 @@
+# SPDX-FileCopyrightText: 2026 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import typing
+
+import pytest
+import yaml
+
+import sunbeam.core.deployments as deployments_mod
+from sunbeam.core.deployment import Deployment
+from sunbeam.core.deployments import (
+    DeploymentsConfig,
+    deployment_path,
+    list_deployments,
+)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "deployments.yaml"
+    path.write_text("{}")
+    return path
+
+
+def _deployment(name: str) -> Deployment:
+    return Deployment(name=name, url="http://localhost", type="test")
+
+
+def test_load_empty_config(config_path):
+    config = DeploymentsConfig.load(config_path)
+
+    assert config.active is None
+    assert config.deployments == []
+
+
+def test_load_corrupted_config(config_path):
+    config_path.write_text("- not\n- a mapping\n")
+
+    with pytest.raises(ValueError):
+        DeploymentsConfig.load(config_path)
+
+
+def test_write_round_trip(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+    config.add_deployment(_deployment("two"))
+
+    reloaded = DeploymentsConfig.load(config_path)
+
+    assert reloaded.active == "two"
+    assert [d.name for d in reloaded.deployments] == ["one", "two"]
+    assert config_path.stat().st_mode & 0o777 == 0o600
+
+
+def test_write_multiline_string_as_literal_block(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(
+        Deployment(name="one", url="line1\nline2\n", type="test"),
+    )
+
+    assert "url: |" in config_path.read_text()
+    data = yaml.safe_load(config_path.read_text())
+    assert data["deployments"][0]["url"] == "line1\nline2\n"
+
+
+def test_load_returns_independent_copies(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+
+    first = DeploymentsConfig.load(config_path)
+    second = DeploymentsConfig.load(config_path)
+    first.deployments.append(_deployment("two"))
+
+    assert first is not second
+    assert [d.name for d in second.deployments] == ["one"]
+    assert second.path == config_path
+
+
+def test_load_picks_up_external_changes(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+    DeploymentsConfig.load(config_path)
+
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "active": "other",
+                "deployments": [
+                    {"name": "other", "url": "http://localhost", "type": "test"}
+                ],
+            }
+        )
+    )
+
+    reloaded = DeploymentsConfig.load(config_path)
+    assert reloaded.active == "other"
+    assert [d.name for d in reloaded.deployments] == ["other"]
+
+
+class _FillingDeployment(Deployment):
+    """Deployment completing region_name at construction, like LocalDeployment."""
+
+    source: typing.ClassVar[list[str]] = []
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        if self.region_name is None:
+            self.region_name = self.source[-1]
+
+
+def test_load_fills_missing_fields_on_every_load(config_path, mocker):
+    mocker.patch.dict(
+        "sunbeam.core.deployment._cls_registry", {"filling": _FillingDeployment}
+    )
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "active": "one",
+                "deployments": [
+                    {"name": "one", "url": "http://localhost", "type": "filling"}
+                ],
+            }
+        )
+    )
+    mocker.patch.object(_FillingDeployment, "source", ["RegionOne"])
+    assert DeploymentsConfig.load(config_path).get_active().region_name == "RegionOne"
+
+    _FillingDeployment.source.append("RegionTwo")
+    reloaded = DeploymentsConfig.load(config_path).get_active()
+
+    assert isinstance(reloaded, _FillingDeployment)
+    assert reloaded.region_name == "RegionTwo"
+
+
+def test_get_update_switch_deployment(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+    config.add_deployment(_deployment("two"))
+
+    assert config.get_deployment("one").name == "one"
+    config.update_deployment(
+        Deployment(name="one", url="http://remote", type="test"),
+    )
+    assert config.get_deployment("one").url == "http://remote"
+    config.switch("one")
+    assert config.active == "one"
+
+    with pytest.raises(ValueError):
+        config.get_deployment("three")
+    with pytest.raises(ValueError):
+        config.update_deployment(_deployment("three"))
+    with pytest.raises(ValueError):
+        config.switch("three")
+
+
+def test_get_deployment_after_direct_list_change(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+    config.add_deployment(_deployment("two"))
+
+    config.deployments.pop(0)
+
+    assert config.get_deployment("two").name == "two"
+    with pytest.raises(ValueError):
+        config.get_deployment("one")
+
+
+def test_duplicated_names_use_first_deployment(config_path):
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "active": "one",
+                "deployments": [
+                    {"name": "one", "url": "http://first", "type": "test"},
+                    {"name": "one", "url": "http://second", "type": "test"},
+                ],
+            }
+        )
+    )
+    config = DeploymentsConfig.load(config_path)
+
+    assert config.get_deployment("one").url == "http://first"
+    config.update_deployment(
+        Deployment(name="one", url="http://remote", type="test"),
+    )
+    assert [d.url for d in config.deployments] == [
+        "http://remote",
+        "http://second",
+    ]
+
+
+def test_get_minimal_info(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+
+    assert config.get_minimal_info() == {
+        "active": "one",
+        "deployments": [
+            {"name": "one", "type": "test", "primary_region_name": None},
+        ],
+    }
+
+
+def test_write_failure_keeps_original(config_path, mocker):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+    original = config_path.read_text()
+
+    mocker.patch.object(deployments_mod.os, "replace", side_effect=OSError("boom"))
+    with pytest.raises(OSError):
+        config.add_deployment(_deployment("two"))
+
+    assert config_path.read_text() == original
+    assert list(config_path.parent.iterdir()) == [config_path]
+
+
+def test_add_existing_deployment(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+
+    with pytest.raises(ValueError, match="already exists"):
+        config.add_deployment(_deployment("one"))
+    assert len(config.deployments) == 1
+
+
+def test_list_deployments(config_path):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+
+    assert list_deployments(config) == {
+        "active": "one",
+        "deployments": [{"name": "one", "url": "http://localhost", "type": "test"}],
+    }
+
+
+def test_deployment_path(snap):
+    path = deployment_path(snap)
+
+    assert path.read_text() == "{}"
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    path.write_text("active: one\n")
+    assert deployment_path(snap) == path
+    assert path.read_text() == "active: one\n"
+
+
+def test_write_skipped_when_unchanged(config_path, mocker):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+    replace = mocker.spy(deployments_mod.os, "replace")
+
+    config.write()
+    DeploymentsConfig.load(config_path).write()
+    DeploymentsConfig.load(config_path).update_deployment(_deployment("one"))
+    replace.assert_not_called()
+
+    config.update_deployment(
+        Deployment(name="one", url="http://remote", type="test"),
+    )
+    replace.assert_called_once()
+
+
+def test_write_after_external_change(config_path, mocker):
+    config = DeploymentsConfig.load(config_path)
+    config.add_deployment(_deployment("one"))
+    config_path.write_text("{}")
+
+    config.write()
+
+    assert DeploymentsConfig.load(config_path).active == "one"
@@ -938,6 +938,21 @@ def test_wait_until_desired_status_timeout(jhelper: jujulib.JujuHelper, juju):
     juju.wait.assert_called_once()
 
 
+def test_wait_backs_off_on_cli_errors(jhelper: jujulib.JujuHelper, juju):
+    juju.wait.side_effect = [
+        jubilant.CLIError(1, "status", stderr="connection lost"),
+        jubilant.CLIError(1, "status", stderr="connection lost"),
+        jubilant.CLIError(1, "status", stderr="connection lost"),
+        None,
+    ]
+
+    with patch("sunbeam.core.juju.time.sleep") as sleep:
+        jhelper._wait(Mock(), juju, delay=3, timeout=60)
+
+    assert juju.wait.call_count == 4
+    assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0, 3]
+
+
 @pytest.mark.parametrize(
     "application_status, unit_list, expected_status, expected_agent_status, expected_workload_status_message, expected_result",
     [
@@ -12,11 +12,13 @@ import yaml
 import sunbeam.core.deployment as deployment_mod
 import sunbeam.core.manifest as manifest_mod
 import sunbeam.core.terraform as terraform_mod
+from sunbeam.core.common import ResultType
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.progress import NoOpReporter
 from sunbeam.core.terraform import (
     TerraformException,
     TerraformHelper,
+    TerraformInitStep,
     TerraformStateLockedException,
 )
 from sunbeam.versions import OPENSTACK_CHANNEL
@@ -843,6 +845,29 @@ class TestTerraformHelper:
                 "opentelemetry-collector-infra": {"persisted": "16G"},
             }
 
+    def test_write_terraformrc(self, snap, tmp_path):
+        snap.paths.user_data.mkdir(parents=True)
+        tfhelper = TerraformHelper(path=tmp_path, plan="test-plan", tfvar_map={})
+
+        tfhelper.write_terraformrc()
+
+        terraform_rc = snap.paths.user_data / ".terraformrc"
+        assert str(snap.paths.snap) in terraform_rc.read_text()
+        assert terraform_rc.stat().st_mode & 0o777 == 0o644
+        assert list(snap.paths.user_data.iterdir()) == [terraform_rc]
+
+    def test_write_terraformrc_failure_cleans_up(self, snap, tmp_path):
+        snap.paths.user_data.mkdir(parents=True)
+        tfhelper = TerraformHelper(path=tmp_path, plan="test-plan", tfvar_map={})
+
+        with (
+            patch.object(terraform_mod.os, "replace", side_effect=OSError("boom")),
+            pytest.raises(OSError),
+        ):
+            tfhelper.write_terraformrc()
+
+        assert list(snap.paths.user_data.iterdir()) == []
+
 
 class TestApplyTfvars:
     """Unit tests for TerraformHelper._apply_tfvars charm-config merging behaviour."""
@@ -1265,3 +1290,42 @@ class TestRunTerraformCommand:
                 env={},
                 reporter=None,
             )
+
+
+class TestTerraformInitStep:
+    def test_run(self):
+        tfhelper = Mock()
+
+        result = TerraformInitStep(tfhelper).run(None)
+
+        assert result.result_type == ResultType.COMPLETED
+        tfhelper.init.assert_called_once_with()
+
+    def test_run_failed(self):
+        tfhelper = Mock()
+        tfhelper.init.side_effect = TerraformException("init failed")
+
+        result = TerraformInitStep(tfhelper).run(None)
+
+        assert result.result_type == ResultType.FAILED
+        assert result.message == "init failed"
+
+    def test_run_multiple_plans(self):
+        tfhelpers = [Mock(), Mock(), Mock()]
+
+        result = TerraformInitStep(*tfhelpers).run(None)
+
+        assert result.result_type == ResultType.COMPLETED
+        for tfhelper in tfhelpers:
+            tfhelper.init.assert_called_once_with()
+
+    def test_run_multiple_plans_failed(self):
+        tfhelpers = [Mock(plan="a"), Mock(plan="b"), Mock(plan="c")]
+        tfhelpers[0].init.side_effect = TerraformException("a failed")
+        tfhelpers[2].init.side_effect = TerraformException("c failed")
+
+        result = TerraformInitStep(*tfhelpers).run(None)
+
+        assert result.result_type == ResultType.FAILED
+        assert result.message == "a failed\nc failed"
+        tfhelpers[1].init.assert_called_once_with()
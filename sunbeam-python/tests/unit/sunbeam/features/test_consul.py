@@ -199,6 +199,72 @@ class TestDeployConsulClientStep:
         jhelper.wait_until_desired_status.assert_called_once()
         assert result.result_type == ResultType.COMPLETED
 
+    @patch(
+        "sunbeam.features.instance_recovery.consul.ConsulFeature.get_config_from_manifest"
+    )
+    def test_get_tfvars_endpoint_bindings(
+        self, mock_get_config, deployment, tfhelper, jhelper, manifest
+    ):
+        spaces = {
+            Networks.MANAGEMENT: "mgmt",
+            Networks.DATA: "data",
+            Networks.STORAGE: "storage",
+        }
+        deployment.get_space.side_effect = spaces.__getitem__
+        mock_get_config.return_value = {}
+
+        step = consul_feature.DeployConsulClientStep(
+            deployment, tfhelper, tfhelper, jhelper, manifest
+        )
+        result = step._get_tfvars()
+
+        assert result["enable-consul-management"] is True
+        assert result["enable-consul-tenant"] is True
+        assert result["enable-consul-storage"] is True
+        bindings = result["consul-endpoint-bindings-map"]
+        for name, space in (
+            ("consul-management", "mgmt"),
+            ("consul-tenant", "data"),
+            ("consul-storage", "storage"),
+        ):
+            assert bindings[name] == [
+                {"space": "mgmt"},
+                {"endpoint": "consul", "space": space},
+                {"endpoint": "consul-notify", "space": space},
+            ]
+        assert result["consul-config-map"]["consul-tenant"]["serf-lan-port"] == (
+            consul_feature.CONSUL_CLIENT_TENANT_SERF_LAN_PORT
+        )
+
+    @patch(
+        "sunbeam.features.instance_recovery.consul.ConsulFeature.consul_servers_to_enable"
+    )
+    def test_run_computes_servers_to_enable_once(
+        self,
+        mock_servers_to_enable,
+        deployment,
+        tfhelper,
+        jhelper,
+        manifest,
+        step_context,
+    ):
+        mock_servers_to_enable.return_value = {
+            consul_feature.ConsulServerNetworks.MANAGEMENT: True,
+            consul_feature.ConsulServerNetworks.TENANT: False,
+            consul_feature.ConsulServerNetworks.STORAGE: True,
+        }
+        step = consul_feature.DeployConsulClientStep(
+            deployment, tfhelper, tfhelper, jhelper, manifest
+        )
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        mock_servers_to_enable.assert_called_once_with(deployment)
+        assert jhelper.wait_until_desired_status.call_args.args[1] == [
+            "consul-client-management",
+            "consul-client-storage",
+        ]
+
     def test_run_tf_apply_failed(
         self,
         deployment,
@@ -321,3 +387,22 @@ class TestConsulFeature:
             ]
         ):
             assert extra_tfvars.get(server) is expected_output[index]
+
+    def test_application_names(self, deployment):
+        deployment.get_space.side_effect = lambda network: {
+            Networks.MANAGEMENT: "mgmt",
+            Networks.DATA: "mgmt",
+            Networks.STORAGE: "storage",
+        }[network]
+
+        consul = consul_feature.ConsulFeature()
+
+        assert consul.enabled_network_values(deployment) == ("management", "storage")
+        assert consul.set_application_names(deployment) == [
+            "consul-management",
+            "consul-storage",
+        ]
+        assert consul.set_consul_client_application_names(deployment) == [
+            "consul-client-management",
+            "consul-client-storage",
+        ]
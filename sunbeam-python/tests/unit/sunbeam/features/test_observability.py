@@ -10,7 +10,7 @@ import pytest
 from sunbeam.clusterd.service import ConfigItemNotFoundException
 from sunbeam.core.common import ResultType
 from sunbeam.core.manifest import Manifest
-from sunbeam.core.terraform import TerraformException
+from sunbeam.core.terraform import TerraformException, TerraformInitStep
 from sunbeam.features.observability import feature as observability_feature
 
 
@@ -57,6 +57,21 @@ def juju_helper_obs():
         yield p
 
 
+def test_get_cos_model_tfvars(deployment, k8shelper):
+    deployment.get_proxy_settings.return_value = {"HTTP_PROXY": "http://proxy"}
+    model_config = {"logging-config": "<root>=DEBUG"}
+
+    tfvars = observability_feature.get_cos_model_tfvars(deployment, "k8s", model_config)
+
+    assert tfvars["model"] == observability_feature.OBSERVABILITY_MODEL
+    assert tfvars["cloud"] == "k8s"
+    assert tfvars["credential"] == "k8s-creds"
+    assert tfvars["config"]["logging-config"] == "<root>=DEBUG"
+    assert tfvars["config"]["juju-http-proxy"] == "http://proxy"
+    assert tfvars["config"]["workload-storage"] == "csi-rawfile-default"
+    assert model_config == {"logging-config": "<root>=DEBUG"}
+
+
 class TestDeployObservabilityStackStep:
     def test_run(
         self,
@@ -976,6 +991,57 @@ class TestExternalObservabilityEnablePlans:
             observability_feature.IntegrateRemoteCosOffersStep
         ) > step_types.index(observability_feature.DeployObservabilityAgentInfraStep)
 
+    @pytest.mark.parametrize("is_maas,nb_plans", [(True, 4), (False, 3)])
+    def test_terraform_plans_initialized_once(
+        self, deployment, run_plan_obs, juju_helper_obs, is_maas, nb_plans
+    ):
+        """All terraform plans are initialized together, before any deployment."""
+        feature = observability_feature.ExternalObservabilityFeature()
+        steps = self._run_enable_plans(
+            feature, deployment, run_plan_obs, is_maas=is_maas
+        )
+
+        init_steps = [step for step in steps if isinstance(step, TerraformInitStep)]
+        assert len(init_steps) == 1
+        assert len(init_steps[0].tfhelpers) == nb_plans
+        assert steps.index(init_steps[0]) < steps.index(
+            next(
+                step
+                for step in steps
+                if isinstance(
+                    step, observability_feature.EnableOpenStackApplicationStep
+                )
+            )
+        )
+
+
+class TestExternalObservabilityDisablePlans:
+    """Test disablement plans for ExternalObservabilityFeature."""
+
+    @pytest.mark.parametrize("is_maas,nb_plans", [(True, 4), (False, 3)])
+    def test_terraform_plans_initialized_once(
+        self, deployment, run_plan_obs, juju_helper_obs, is_maas, nb_plans
+    ):
+        """All terraform plans are initialized together, in a plan of their own."""
+        feature = observability_feature.ExternalObservabilityFeature()
+        feature._manifest = Mock()
+        with patch(
+            "sunbeam.features.observability.feature.is_maas_deployment",
+            return_value=is_maas,
+        ):
+            feature.run_disable_plans(deployment, False)
+
+        plans = [call.args[0] for call in run_plan_obs.call_args_list]
+        init_steps = [
+            step
+            for plan in plans
+            for step in plan
+            if isinstance(step, TerraformInitStep)
+        ]
+        assert len(init_steps) == 1
+        assert plans[0] == init_steps
+        assert len(init_steps[0].tfhelpers) == nb_plans
+
 
 class TestObservabilityFeatureTimeouts:
     """Test timeout calculation for ObservabilityFeature."""
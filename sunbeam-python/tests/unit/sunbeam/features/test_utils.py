@@ -2,17 +2,36 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import base64
+import datetime
 from unittest.mock import patch
 
+import click
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
 from sunbeam.features.interface.utils import (
+    _load_certificate,
     decode_base64_as_string,
     encode_base64_as_string,
     generate_ca_chain,
+    get_all_registered_groups,
+    is_ca_certificate,
+    is_certificate_valid,
     validate_ca_certificate,
     validate_ca_chain,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_certificate_cache():
+    _load_certificate.cache_clear()
+    yield
+    _load_certificate.cache_clear()
+
+
 def test_generate_ca_chain():
     cert1 = "CERT1"
     cert2 = "CERT2"
@@ -28,6 +47,30 @@ def test_generate_ca_chain():
     assert ca_chain_decoded == expected_chain
 
 
+def test_get_all_registered_groups():
+    @click.group("init")
+    def cli():
+        pass
+
+    @cli.group()
+    def enable():
+        pass
+
+    @enable.group()
+    def tls():
+        pass
+
+    @cli.command()
+    def bootstrap():
+        pass
+
+    assert get_all_registered_groups(cli) == {
+        "init": cli,
+        "enable": enable,
+        "enable.tls": tls,
+    }
+
+
 def test_validate_ca_certificate_normalizes_crlf():
     """validate_ca_certificate strips CRLF and returns clean base64."""
     cert_crlf = b"-----BEGIN CERTIFICATE-----\r\nDATA\r\n-----END CERTIFICATE-----\r\n"
@@ -56,3 +99,94 @@ def test_validate_ca_chain_normalizes_crlf():
         result = validate_ca_chain(None, None, encoded)
 
     assert base64.b64decode(result) == chain_lf
+
+
+def _make_ca(name: str, issuer: tuple | None = None) -> tuple:
+    key = ec.generate_private_key(ec.SECP256R1())
+    subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, name)])
+    issuer_name, issuer_key = issuer if issuer else (subject, key)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(issuer_name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(issuer_key, hashes.SHA256())
+    )
+    return cert, key
+
+
+@pytest.fixture(scope="module")
+def ca_chain_pems():
+    root, root_key = _make_ca("root")
+    intermediate, _ = _make_ca("intermediate", (root.subject, root_key))
+    return [
+        cert.public_bytes(serialization.Encoding.PEM) for cert in (intermediate, root)
+    ]
+
+
+def test_validate_ca_chain_in_order(ca_chain_pems):
+    encoded = base64.b64encode(b"".join(ca_chain_pems)).decode()
+
+    assert validate_ca_chain(None, None, encoded) == encoded
+
+
+def test_validate_ca_chain_wrong_order(ca_chain_pems):
+    encoded = base64.b64encode(b"".join(reversed(ca_chain_pems))).decode()
+
+    with pytest.raises(click.BadParameter):
+        validate_ca_chain(None, None, encoded)
+
+
+def test_validate_ca_chain_parses_each_cert_once(ca_chain_pems):
+    encoded = base64.b64encode(b"".join(ca_chain_pems)).decode()
+
+    with patch(
+        "sunbeam.features.interface.utils.x509.load_pem_x509_certificate",
+        side_effect=x509.load_pem_x509_certificate,
+    ) as load:
+        validate_ca_chain(None, None, encoded)
+
+    assert load.call_count == len(ca_chain_pems)
+
+
+def test_validate_ca_chain_invalid_certificate():
+    chain = b"-----BEGIN CERTIFICATE-----\nNOTACERT\n-----END CERTIFICATE-----\n"
+    encoded = base64.b64encode(chain).decode()
+
+    with pytest.raises(click.BadParameter):
+        validate_ca_chain(None, None, encoded)
+
+
+def test_certificate_checks_parse_once(ca_chain_pems):
+    encoded = base64.b64encode(ca_chain_pems[1]).decode()
+
+    with patch(
+        "sunbeam.features.interface.utils.x509.load_pem_x509_certificate",
+        side_effect=x509.load_pem_x509_certificate,
+    ) as load:
+        assert is_certificate_valid(encoded)
+        assert is_ca_certificate(encoded)
+        assert validate_ca_certificate(None, None, encoded) == encoded
+
+    load.assert_called_once()
+
+
+def test_is_certificate_valid_invalid():
+    chain = b"-----BEGIN CERTIFICATE-----\nNOTACERT\n-----END CERTIFICATE-----\n"
+
+    assert not is_certificate_valid(base64.b64encode(chain))
+    assert not is_certificate_valid(b"not base64!")
+    assert not is_certificate_valid(b"")
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_validate_ca_chain_empty(value):
+    with patch("sunbeam.features.interface.utils.base64.b64decode") as b64decode:
+        assert validate_ca_chain(None, None, value) == value
+
+    b64decode.assert_not_called()
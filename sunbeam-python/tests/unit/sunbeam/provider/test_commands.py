@@ -4,7 +4,12 @@
 from unittest.mock import Mock
 
 import click
+import pytest
+import yaml
+from click.testing import CliRunner
 
+from sunbeam.core.deployment import Deployment
+from sunbeam.core.deployments import DeploymentsConfig, deployment_path
 from sunbeam.provider import commands as provider_commands
 from sunbeam.provider.maas.steps import MaasSaveClusterdCredentialsStep
 
@@ -25,3 +30,38 @@ def test_update_clusterd_credentials_invokes_plan(tmp_path, mocker):
     assert run_plan_spy.call_count == 1
     plan = run_plan_spy.call_args_list[0][0][0]
     assert isinstance(plan[0], MaasSaveClusterdCredentialsStep)
+
+
+@pytest.fixture
+def deployments(snap, mocker):
+    mocker.patch.object(provider_commands, "run_preflight_checks")
+    config = DeploymentsConfig.load(deployment_path(snap))
+    config.add_deployment(
+        Deployment(name="one", url="http://localhost", type="test"),
+    )
+    config.add_deployment(
+        Deployment(name="two", url="http://remote", type="test"),
+    )
+    return config
+
+
+def test_list_format_yaml(deployments):
+    result = CliRunner().invoke(provider_commands.list_providers, ["--format", "yaml"])
+
+    assert result.exit_code == 0, result.output
+    assert yaml.safe_load(result.output) == {
+        "active": "two",
+        "deployments": [
+            {"name": "one", "url": "http://localhost", "type": "test"},
+            {"name": "two", "url": "http://remote", "type": "test"},
+        ],
+    }
+
+
+def test_show_format_yaml(deployments):
+    result = CliRunner().invoke(provider_commands.show, ["one", "--format", "yaml"])
+
+    assert result.exit_code == 0, result.output
+    output = yaml.safe_load(result.output)
+    assert output == deployments.get_deployment("one").model_dump()
+    assert output["url"] == "http://localhost"
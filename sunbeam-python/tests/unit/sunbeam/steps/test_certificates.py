@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from unittest.mock import MagicMock, Mock
+
+from sunbeam.core.common import ResultType
+from sunbeam.steps.certificates import (
+    APPLICATION,
+    CERTIFICATES_APP_TIMEOUT,
+    DeployCertificatesProviderApplicationStep,
+)
+
+
+def test_run(jhelper, step_context):
+    jhelper.get_model_status.return_value = Mock(
+        machines={"0": Mock(), "1": Mock()}, apps={"sunbeam-machine": Mock()}
+    )
+    step = DeployCertificatesProviderApplicationStep(jhelper, MagicMock(), "infra")
+
+    result = step.run(step_context)
+
+    assert result.result_type == ResultType.COMPLETED
+    jhelper.get_model_status.assert_called_once_with("infra")
+    assert jhelper.deploy.call_args.kwargs["to"] == ["0"]
+    jhelper.wait_until_active.assert_called_once_with(
+        "infra",
+        ["sunbeam-machine", APPLICATION],
+        timeout=CERTIFICATES_APP_TIMEOUT,
+    )
+
+
+def test_run_no_machines(jhelper, step_context):
+    jhelper.get_model_status.return_value = Mock(machines={}, apps={})
+    step = DeployCertificatesProviderApplicationStep(jhelper, MagicMock(), "infra")
+
+    result = step.run(step_context)
+
+    assert result.result_type == ResultType.FAILED
+    jhelper.deploy.assert_not_called()
+
+
+def test_run_wait_timeout(jhelper, step_context, caplog):
+    app = Mock(app_status=Mock(current="waiting", message="waiting for relation certs"))
+    jhelper.get_model_status.side_effect = [
+        Mock(machines={"0": Mock()}, apps={"sunbeam-machine": Mock()}),
+        Mock(machines={"0": Mock()}, apps={APPLICATION: app}),
+    ]
+    jhelper.wait_until_active.side_effect = TimeoutError("timed out")
+    step = DeployCertificatesProviderApplicationStep(jhelper, MagicMock(), "infra")
+
+    with caplog.at_level(logging.WARNING, logger="sunbeam.steps.certificates"):
+        result = step.run(step_context)
+
+    assert result.result_type == ResultType.FAILED
+    assert jhelper.wait_until_active.call_args.args[1] == [
+        "sunbeam-machine",
+        APPLICATION,
+    ]
+    assert "'sunbeam-machine' workload status: missing" in caplog.text
+    assert "waiting for relation certs" in caplog.text
+
+
+def test_run_wait_timeout_status_unavailable(jhelper, step_context):
+    jhelper.get_model_status.side_effect = [
+        Mock(machines={"0": Mock()}, apps={APPLICATION: Mock()}),
+        TimeoutError("unreachable"),
+    ]
+    jhelper.wait_until_active.side_effect = TimeoutError("timed out")
+    step = DeployCertificatesProviderApplicationStep(jhelper, MagicMock(), "infra")
+
+    result = step.run(step_context)
+
+    assert result.result_type == ResultType.FAILED
+    assert result.message == "timed out"
@@ -3,6 +3,7 @@
 
 import base64
 import json
+import string
 import textwrap
 from unittest.mock import mock_open, patch
 
@@ -164,6 +165,21 @@ class TestUtils:
         generate_password.return_value = "abcdefghijkl"
         assert utils.generate_password() == "abcdefghijkl"
 
+    @pytest.mark.parametrize("length", [0, 1, 12, 32, 1000])
+    def test_random_string(self, length):
+        value = utils.random_string(length)
+        assert len(value) == length
+        assert set(value) <= set(string.ascii_letters + string.digits)
+
+    def test_random_string_rejects_out_of_alphabet_bytes(self, mocker):
+        # 0x3E and 0x3F map past the alphabet and must be skipped
+        mocker.patch.object(
+            utils.secrets,
+            "token_bytes",
+            side_effect=[b"\x3e\x3f\x00\x01", b"\x3d" * 16],
+        )
+        assert utils.random_string(3) == "ab9"
+
     def test_get_local_cidr_matching_token_success(self, mocker):
         """Test successful CIDR resolution from join token."""
         mock_get_local_cidr = mocker.patch(